@@ -11,15 +11,228 @@
 - 剔除连续涨停 4 天及以上的股票
 
 输出：符合条件的股票代码 + 名称
+
+用法：
+    python zt_filter_strategy.py                      # 交互输入日期（非终端运行时直接用今天）
+    python zt_filter_strategy.py --date 20250120
+    python zt_filter_strategy.py --dates-from dates.txt   # 文件中每行一个 YYYYMMDD
 """
 
+import argparse
+import os
+import sys
+import time
 import akshare as ak
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import warnings
 
 warnings.filterwarnings("ignore")
 
+# 字符串列类型：有 pyarrow 时显式使用 Arrow 存储（连续缓冲区）；
+# 否则退回 pandas 默认 string 类型（pandas 2.x 下仍为逐个 Python 对象存储）
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = "string[pyarrow]"
+except ImportError:
+    STRING_DTYPE = "string"
+
+# 涨停池本地缓存目录（收盘后写入的数据不会再变化，命中后无需重复请求网络）
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "zt_pool")
+# 收盘前写入的缓存只是盘中快照，有效期 10 分钟
+TODAY_CACHE_TTL = 600
+# A 股收盘时间（小时）
+MARKET_CLOSE_HOUR = 15
+# A 股交易日历本地缓存
+TRADING_DAYS_CACHE = os.path.join(os.path.dirname(CACHE_DIR), "trading_days.pkl")
+# 多日期时并发拉取涨停池的线程数（网络 I/O 为主，等待期间不占用 GIL）
+MAX_FETCH_WORKERS = 8
+# 浮点列统一保留两位小数输出，省去 pandas 逐列推断显示精度
+FLOAT_FORMAT = "{:.2f}".format
+
+# 各字段的候选列名，按优先级排列（不同版本 akshare 字段可能有轻微差异，这里做一下兼容）
+# 最新价
+PRICE_COLS = ("最新价", "现价", "收盘价")
+# 总市值（单位：亿元，注意可能是元需要转换）
+MKTCAP_COLS = ("总市值", "总市值(亿)", "总市值-亿")
+# 连续涨停天数
+LIANBAN_COLS = ("连续涨停天数", "连板数", "连板次数")
+# 近半年涨停次数（注意"涨停统计"可能是"总次数/半年次数"格式）
+TIMES_COLS = ("涨停统计", "半年涨停次数", "近半年涨停次数")
+
+# 列名别名 -> (字段, 优先级)，导入时构建一次
+ALIAS = {
+    c: (field, rank)
+    for field, candidates in (
+        ("price", PRICE_COLS),
+        ("mktcap", MKTCAP_COLS),
+        ("lianban", LIANBAN_COLS),
+        ("times", TIMES_COLS),
+    )
+    for rank, c in enumerate(candidates)
+}
+
+
+@dataclass(slots=True)
+class ColumnMap:
+    """涨停池各字段对应的实际列名，None 表示该字段缺失"""
+    code: str | None = None
+    name: str | None = None
+    price: str | None = None
+    mktcap: str | None = None
+    lianban: str | None = None
+    times: str | None = None
+
+
+def resolve_columns(df: pd.DataFrame) -> ColumnMap:
+    """一次遍历列名解析出各字段的实际列名，同一字段存在多个候选列时按候选优先级选取"""
+    best = {}
+    for c in df.columns:
+        hit = ALIAS.get(c)
+        if hit and (hit[0] not in best or hit[1] < best[hit[0]][1]):
+            best[hit[0]] = (c, hit[1])
+    return ColumnMap(
+        code="代码" if "代码" in df.columns else None,
+        name="名称" if "名称" in df.columns else None,
+        **{field: c for field, (c, _) in best.items()},
+    )
+
+
+def _pool_columns(df: pd.DataFrame) -> ColumnMap | None:
+    """
+    取 _prepare_pool 挂在 attrs 上的列名映射
+
+    pandas 会把 attrs 带到投影、重命名后的新对象上，因此映射中的列不全在 df 中时视为失效，返回 None
+    """
+    cols = df.attrs.get("cols")
+    if not isinstance(cols, ColumnMap):
+        return None
+    names = (cols.code, cols.name, cols.price, cols.mktcap, cols.lianban, cols.times)
+    if all(c is None or c in df.columns for c in names):
+        return cols
+    return None
+
+
+def _cache_path(date: str) -> str:
+    return os.path.join(CACHE_DIR, f"{date}.pkl")
+
+
+def _load_cache(date: str) -> pd.DataFrame | None:
+    """读取本地缓存，未命中或已过期返回 None"""
+    path = _cache_path(date)
+    if not os.path.exists(path):
+        return None
+    # 只有在该日收盘后写入的缓存才视为最终数据；盘中快照即使日期已过也按有效期判断
+    mtime = os.path.getmtime(path)
+    try:
+        close_time = datetime.strptime(date, "%Y%m%d") + timedelta(hours=MARKET_CLOSE_HOUR)
+    except ValueError:
+        return None
+    if datetime.fromtimestamp(mtime) < close_time and time.time() - mtime > TODAY_CACHE_TTL:
+        return None
+    try:
+        return pd.read_pickle(path)
+    except Exception:
+        return None
+
+
+def _save_cache(date: str, df: pd.DataFrame) -> None:
+    """写入本地缓存，空数据不缓存（可能是休市日或接口异常）"""
+    if df.empty:
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        df.to_pickle(_cache_path(date))
+    except Exception as e:
+        print(f"写入 {date} 涨停池缓存失败: {e}")
+
+
+# 交易日集合（None 表示尚未加载）及其中最后一个交易日
+_trading_days = None
+_last_trading_day = ""
+# 本进程内是否已尝试过刷新日历，避免每次调用都重新请求
+_calendar_refreshed = False
+
+
+def _load_trading_days(refresh: bool = False) -> set:
+    """
+    加载交易日集合（YYYYMMDD），优先读本地缓存，缺失或 refresh 时从新浪获取
+
+    获取失败时记录为空集合（已加载过则保留原集合），本进程内不再重试
+    """
+    global _trading_days, _last_trading_day
+    if _trading_days is not None and not refresh:
+        return _trading_days
+
+    df = None
+    if not refresh and os.path.exists(TRADING_DAYS_CACHE):
+        try:
+            df = pd.read_pickle(TRADING_DAYS_CACHE)
+        except Exception:
+            df = None
+    if df is None:
+        try:
+            df = ak.tool_trade_date_hist_sina()
+            os.makedirs(os.path.dirname(TRADING_DAYS_CACHE), exist_ok=True)
+            df.to_pickle(TRADING_DAYS_CACHE)
+        except Exception as e:
+            print(f"获取交易日历失败: {e}")
+            if _trading_days is None:
+                _trading_days = set()
+            return _trading_days
+
+    _trading_days = set(pd.to_datetime(df["trade_date"]).dt.strftime("%Y%m%d"))
+    _last_trading_day = max(_trading_days, default="")
+    return _trading_days
+
+
+def is_trading_day(date: str) -> bool:
+    """
+    判断指定日期是否为 A 股交易日
+
+    交易日历不可用或未覆盖该日期时返回 True，交由涨停池接口自行判断
+    """
+    global _calendar_refreshed
+    days = _load_trading_days()
+    if days and date > _last_trading_day and not _calendar_refreshed:
+        # 本地日历已过期（如跨年），本进程内只重新获取一次
+        _calendar_refreshed = True
+        days = _load_trading_days(refresh=True)
+    if not days or date > _last_trading_day:
+        return True
+    return date in days
+
+
+def _prepare_pool(df: pd.DataFrame) -> pd.DataFrame:
+    """对原始涨停池做一次性预处理（缓存中保存的是原始数据）"""
+    # 只保留后续用到的列（代码、名称及 ALIAS 中的字段），减少后续各步处理的数据量
+    # 缺少代码/名称时保留全部列，便于 main 中打印可用列名排查
+    if "代码" in df.columns and "名称" in df.columns:
+        df = df[[c for c in df.columns if c in ("代码", "名称") or c in ALIAS]]
+
+    # 列名只在这里解析一次，挂到 attrs 上供 filter_stocks 和 main 直接使用
+    cols = resolve_columns(df)
+
+    # 代码、名称转为 STRING_DTYPE，比较、排序不再逐个处理 Python 字符串对象
+    updates = {c: df[c].astype(STRING_DTYPE) for c in (cols.code, cols.name) if c}
+
+    # 处理市值单位：取第一个有效值判断，大于1000说明是元，需要除以1e8转换为亿元
+    # 只在这里做一次，filter_stocks 和 main 拿到的都是亿元
+    if cols.mktcap:
+        mktcap = pd.to_numeric(df[cols.mktcap], errors="coerce")
+        valid = mktcap.dropna()
+        if not valid.empty and valid.iat[0] > 1000:
+            mktcap = mktcap / 1e8
+        updates[cols.mktcap] = mktcap
+
+    # 通过 assign 生成新对象，不修改传入的数据（也避免在列投影结果上原地赋值）
+    df = df.assign(**updates)
+    df.attrs["cols"] = cols
+    return df
+
 
 def get_limit_up_stocks(date: str = None) -> pd.DataFrame:
     """
@@ -33,62 +246,52 @@ def get_limit_up_stocks(date: str = None) -> pd.DataFrame:
     if date is None:
         date = datetime.now().strftime("%Y%m%d")
 
-    try:
-        df = ak.stock_zt_pool_em(date=date)
-        # 常见列名（可能随时间略有调整）：
-        # '代码', '名称', '最新价', '总市值', '连续涨停天数', '涨停统计', ...
-        return df
-    except Exception as e:
-        print(f"获取 {date} 涨停池数据失败: {e}")
-        return pd.DataFrame()
+    df = _load_cache(date)
+    if df is None:
+        try:
+            df = ak.stock_zt_pool_em(date=date)
+            # 常见列名（可能随时间略有调整）：
+            # '代码', '名称', '最新价', '总市值', '连续涨停天数', '涨停统计', ...
+            _save_cache(date, df)
+        except Exception as e:
+            print(f"获取 {date} 涨停池数据失败: {e}")
+            return pd.DataFrame()
+
+    return _prepare_pool(df)
 
 
 def filter_stocks(df: pd.DataFrame) -> pd.DataFrame:
     """
     按策略条件过滤涨停股
+
+    df 通常来自 get_limit_up_stocks；直接传入原始涨停池时会先补做同样的预处理（含市值单位换算）
     """
     if df.empty:
         return df
 
-    # 复制一份，避免修改原数据
-    data = df.copy()
+    # 不整表复制；后续修改均通过 assign 生成新对象，不会改动调用方传入的原数据
+    data = df
 
     # 统一列名（不同版本 akshare 字段可能有轻微差异，这里做一下兼容）
-    col_code = "代码"
-    col_name = "名称"
-
-    # 最新价
-    price_cols = ["最新价", "现价", "收盘价"]
-    col_price = next((c for c in price_cols if c in data.columns), None)
-
-    # 总市值（单位：亿元，注意可能是元需要转换）
-    mktcap_cols = ["总市值", "总市值(亿)", "总市值-亿"]
-    col_mktcap = next((c for c in mktcap_cols if c in data.columns), None)
+    # 优先使用 get_limit_up_stocks 已预处理好的数据，否则（或列名映射已失效时）在这里补做预处理
+    cols = _pool_columns(data)
+    if cols is None:
+        data = _prepare_pool(data)
+        cols = data.attrs["cols"]
+    col_code = cols.code
+    col_name = cols.name
+    col_price = cols.price
+    col_mktcap = cols.mktcap
+    col_lianban = cols.lianban
+    col_times = cols.times
 
-    # 连续涨停天数
-    lianban_cols = ["连续涨停天数", "连板数", "连板次数"]
-    col_lianban = next((c for c in lianban_cols if c in data.columns), None)
-
-    # 近半年涨停次数（注意"涨停统计"可能是"总次数/半年次数"格式）
-    times_cols = ["涨停统计", "半年涨停次数", "近半年涨停次数"]
-    col_times = next((c for c in times_cols if c in data.columns), None)
-    
     # 如果找到"涨停统计"列，需要解析"总次数/半年次数"格式
     if col_times == "涨停统计" and col_times in data.columns:
         # 解析"总次数/半年次数"格式，提取后半部分（半年次数）
-        def extract_half_year_times(x):
-            if pd.isna(x):
-                return 0
-            try:
-                if isinstance(x, str) and '/' in x:
-                    parts = x.split('/')
-                    if len(parts) >= 2:
-                        return int(parts[1])  # 取后半部分（半年次数）
-                return int(float(x))
-            except:
-                return 0
-        
-        data['近半年涨停次数_解析'] = data[col_times].apply(extract_half_year_times)
+        # 使用向量化正则提取，不匹配时得到 NA 而非抛异常；没有"/"时整体即为次数
+        times_str = data[col_times].astype(STRING_DTYPE)
+        half_year = times_str.str.extract(r"/(\d+)", expand=False).fillna(times_str)
+        data = data.assign(近半年涨停次数_解析=pd.to_numeric(half_year, errors="coerce").fillna(0).astype(int))
         col_times = '近半年涨停次数_解析'
 
     missing = []
@@ -104,27 +307,25 @@ def filter_stocks(df: pd.DataFrame) -> pd.DataFrame:
     if missing:
         print("数据列缺失，无法完整按策略过滤，缺失列：", ", ".join(missing))
         # 只返回代码和名称
-        return data[[col_code, col_name]] if all(c in data.columns for c in [col_code, col_name]) else data
+        result = data[[col_code, col_name]] if all(c in data.columns for c in [col_code, col_name]) else data.copy(deep=False)
+        # 结果的列已与 attrs 中的列名映射不符，清掉以免被误用
+        result.attrs = {}
+        return result
 
     # 转换数值类型，出错的设为 NaN
-    for c in [col_price, col_mktcap, col_lianban, col_times]:
-        if c:
-            data[c] = pd.to_numeric(data[c], errors="coerce")
-
-    # 处理市值单位：如果最大值大于1000，说明是元，需要除以1e8转换为亿元
-    if col_mktcap:
-        max_mktcap = data[col_mktcap].max()
-        if pd.notna(max_mktcap) and max_mktcap > 1000:
-            data[col_mktcap] = data[col_mktcap] / 1e8  # 转换为亿元
-
-    # 条件过滤
-    cond_price = data[col_price] < 30 if col_price else pd.Series([True] * len(data), index=data.index)  # 单价 < 30
-    cond_mktcap = data[col_mktcap] < 200 if col_mktcap else pd.Series([True] * len(data), index=data.index)  # 总市值 < 200 亿
-    cond_times = data[col_times] >= 3 if col_times else pd.Series([True] * len(data), index=data.index)  # 半年内涨停次数 >= 3
-    cond_lianban_lt4 = data[col_lianban] < 4 if col_lianban else pd.Series([True] * len(data), index=data.index)  # 连板 < 4
-    cond_first_board = data[col_lianban] == 1 if col_lianban else pd.Series([True] * len(data), index=data.index)  # 仅首板
-
-    filtered = data[cond_price & cond_mktcap & cond_times & cond_lianban_lt4 & cond_first_board].copy()
+    # 四列一次性转换并整体赋回，只产生一次数据块更新
+    numeric_cols = [c for c in (col_price, col_mktcap, col_lianban, col_times) if c]
+    converted = data[numeric_cols].apply(pd.to_numeric, errors="coerce")
+    data = data.assign(**{c: converted[c] for c in numeric_cols})
+
+    # 条件过滤：直接在 NumPy 数组上一次性组合条件，避免生成多个中间 Series
+    # 统一取出连续的 float64 数组（缺失值为 NaN），不论列是何种扩展类型都走 NumPy 原生比较
+    # 仅首板（连板数 == 1）已隐含"剔除 4 连板及以上"，无需单独判断
+    price = data[col_price].to_numpy(dtype=np.float64, na_value=np.nan)
+    mktcap = data[col_mktcap].to_numpy(dtype=np.float64, na_value=np.nan)
+    times = data[col_times].to_numpy(dtype=np.float64, na_value=np.nan)
+    lianban = data[col_lianban].to_numpy(dtype=np.float64, na_value=np.nan)
+    mask = (price < 30) & (mktcap < 200) & (times >= 3) & (lianban == 1)
 
     # 只保留关键信息
     keep_cols = [col_code, col_name]
@@ -136,8 +337,6 @@ def filter_stocks(df: pd.DataFrame) -> pd.DataFrame:
         keep_cols.append(col_lianban)
     if col_times:
         keep_cols.append(col_times)
-    
-    filtered = filtered[keep_cols]
 
     # 重命名为更直观的中文列名
     rename_map = {
@@ -152,102 +351,81 @@ def filter_stocks(df: pd.DataFrame) -> pd.DataFrame:
         rename_map[col_lianban] = "连板数"
     if col_times:
         rename_map[col_times] = "近半年涨停次数"
-    
-    filtered.rename(columns=rename_map, inplace=True)
 
+    # 过滤、取列、重命名、排序一次链式完成，避免中间结果反复落地
     # 按近半年涨停次数降序、连板数降序排序
-    filtered.sort_values(
-        by=["近半年涨停次数", "连板数", "总市值(亿)"],
-        ascending=[False, False, True],
-        inplace=True,
+    result = (
+        data.loc[mask, keep_cols]
+        .rename(columns=rename_map)
+        .sort_values(
+            by=["近半年涨停次数", "连板数", "总市值(亿)"],
+            ascending=[False, False, True],
+            ignore_index=True,
+        )
     )
+    # 结果的列已重命名，清掉从原数据带过来的列名映射
+    result.attrs = {}
+    return result
 
-    filtered.reset_index(drop=True, inplace=True)
-    return filtered
 
+def _read_dates(path: str) -> list:
+    """读取日期列表文件，每行一个 YYYYMMDD，忽略空行和 # 注释"""
+    with open(path, encoding="utf-8") as f:
+        lines = (line.split("#", 1)[0].strip() for line in f)
+        return [line for line in lines if line]
 
-def main():
-    """主函数：统计并输出符合条件的涨停股"""
-    print("=" * 70)
-    print("当日涨停选股策略（30元以下 & 200亿以下 & 半年涨停≥3 & 剔除4连板及以上）")
-    print("=" * 70)
 
-    # 默认今天，也支持手动输入日期
-    today_str = datetime.now().strftime("%Y%m%d")
-    print(f"\n默认分析日期：{today_str}")
-    user_date = input("如需指定日期，请输入 YYYYMMDD（直接回车使用默认日期）：").strip()
-    if user_date:
-        date = user_date
-    else:
-        date = today_str
+def report(date: str, df_zt: pd.DataFrame = None):
+    """
+    统计并输出指定日期符合条件的涨停股
 
-    print(f"\n正在获取 {date} 的涨停板股票池数据...")
-    df_zt = get_limit_up_stocks(date)
+    Parameters
+    ----------
+    date : str
+        日期，格式为 YYYYMMDD
+    df_zt : pd.DataFrame
+        已获取的涨停池；None 表示在这里获取
+    """
+    if not is_trading_day(date):
+        print(f"\n{date} 为休市日，跳过。")
+        return
+
+    if df_zt is None:
+        print(f"\n正在获取 {date} 的涨停板股票池数据...")
+        df_zt = get_limit_up_stocks(date)
 
     if df_zt.empty:
         print("未获取到涨停数据，可能是休市日或网络问题。")
         return
 
     print(f"\n{'='*70}")
-    print(f"📊 当日全部涨停股票（共 {len(df_zt)} 只）")
+    print(f"📊 {date} 全部涨停股票（共 {len(df_zt)} 只）")
     print(f"{'='*70}")
     
     # 显示全部涨停股票
-    if "代码" in df_zt.columns and "名称" in df_zt.columns:
-        # 准备显示的列
-        all_display_cols = ["代码", "名称"]
-        
-        # 添加价格列（如果存在）
-        price_cols = ["最新价", "现价", "收盘价"]
-        for col in price_cols:
-            if col in df_zt.columns:
-                all_display_cols.append(col)
-                break
-        
-        # 添加市值列（如果存在，并转换为亿元显示）
-        mktcap_cols = ["总市值", "总市值(亿)", "总市值-亿"]
-        col_mktcap = None
-        for col in mktcap_cols:
-            if col in df_zt.columns:
-                col_mktcap = col
-                all_display_cols.append(col)
-                break
-        
-        # 添加连板数列（如果存在）
-        lianban_cols = ["连续涨停天数", "连板数", "连板次数"]
-        for col in lianban_cols:
-            if col in df_zt.columns:
-                all_display_cols.append(col)
-                break
-        
-        # 添加涨停统计列（如果存在）
-        times_cols = ["涨停统计", "半年涨停次数", "近半年涨停次数"]
-        for col in times_cols:
-            if col in df_zt.columns:
-                all_display_cols.append(col)
-                break
-        
+    cols = _pool_columns(df_zt)
+    if cols is None:
+        df_zt = _prepare_pool(df_zt)
+        cols = df_zt.attrs["cols"]
+    if cols.code and cols.name:
+        # 准备显示的列：代码、名称，以及存在的价格、市值、连板数、涨停统计列
+        col_mktcap = cols.mktcap
+        all_display_cols = [
+            c for c in (cols.code, cols.name, cols.price, cols.mktcap, cols.lianban, cols.times) if c
+        ]
+
         # 显示全部涨停股票
-        all_cols = [c for c in all_display_cols if c in df_zt.columns]
-        display_df = df_zt[all_cols].copy()
-        
-        # 如果市值是元为单位，转换为亿元显示
-        if col_mktcap and col_mktcap in display_df.columns:
-            try:
-                display_df[col_mktcap] = pd.to_numeric(display_df[col_mktcap], errors='coerce')
-                # 如果最大值大于1000，说明是元，需要除以1e8转换为亿元
-                if display_df[col_mktcap].max() > 1000:
-                    display_df[f"{col_mktcap}(亿)"] = display_df[col_mktcap] / 1e8
-                    display_df = display_df.drop(columns=[col_mktcap])
-                    all_cols = [c if c != col_mktcap else f"{col_mktcap}(亿)" for c in all_cols]
-            except:
-                pass
-        
-        print(display_df.to_string(index=False))
+        display_df = df_zt[all_display_cols]
+
+        # 市值已在 get_limit_up_stocks 中统一为亿元，这里只调整列名
+        if col_mktcap:
+            display_df = display_df.rename(columns={col_mktcap: "总市值(亿)"})
+
+        print(display_df.to_string(index=False, float_format=FLOAT_FORMAT))
     else:
         # 如果列名不匹配，显示所有列
         print("可用列名：", list(df_zt.columns))
-        print(df_zt.head(50).to_string(index=False))
+        print(df_zt.head(50).to_string(index=False, float_format=FLOAT_FORMAT))
         if len(df_zt) > 50:
             print(f"\n... 还有 {len(df_zt) - 50} 只股票未显示")
 
@@ -274,7 +452,46 @@ def main():
     display_cols = [c for c in display_cols if c in result.columns]
 
     print(f"符合条件的股票数量：{len(result)} 只\n")
-    print(result[display_cols].to_string(index=False))
+    print(result[display_cols].to_string(index=False, float_format=FLOAT_FORMAT))
+
+
+def main():
+    """主函数：解析日期参数，逐日统计并输出符合条件的涨停股"""
+    parser = argparse.ArgumentParser(description="当日涨停选股策略")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--date", default=None, help="分析日期 YYYYMMDD，默认今天")
+    group.add_argument("--dates-from", default=None, help="日期列表文件，每行一个 YYYYMMDD")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("当日涨停选股策略（30元以下 & 200亿以下 & 半年涨停≥3 & 剔除4连板及以上）")
+    print("=" * 70)
+
+    if args.dates_from:
+        dates = _read_dates(args.dates_from)
+    elif args.date:
+        dates = [args.date]
+    else:
+        # 默认今天；仅在终端交互运行时才提示手动输入，cron/管道调用不会卡住
+        date = datetime.now().strftime("%Y%m%d")
+        if sys.stdin.isatty():
+            print(f"\n默认分析日期：{date}")
+            user_date = input("如需指定日期，请输入 YYYYMMDD（直接回车使用默认日期）：").strip()
+            if user_date:
+                date = user_date
+        dates = [date]
+
+    # 多个日期时先并发拉取各交易日的涨停池（缓存命中的直接读本地），再按顺序输出
+    pools = {}
+    # 去重并保持输入顺序，同一天只拉取一次，避免重复请求和并发写同一缓存文件
+    fetch_dates = list(dict.fromkeys(d for d in dates if is_trading_day(d)))
+    if len(fetch_dates) > 1:
+        print(f"\n正在并发获取 {len(fetch_dates)} 个交易日的涨停板股票池数据...")
+        with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as ex:
+            pools = dict(zip(fetch_dates, ex.map(get_limit_up_stocks, fetch_dates)))
+
+    for date in dates:
+        report(date, pools.get(date))
 
 
 if __name__ == "__main__":